@@ -163,3 +163,28 @@ def test_jump_down_tree():
     with record_history() as h:
         client["e"]["d"]["c"]["b"]["a"]
     assert len(h.requests) == 5
+
+
+def test_new_variation_unchanged():
+    tree = MapAdapter({"a": MapAdapter({})})
+    with Context.from_app(build_app(tree)) as context:
+        client = from_context(context)
+        # With nothing to vary, the same object is returned.
+        assert client.new_variation() is client
+        # Otherwise, a new object is constructed.
+        assert client.new_variation(sorting=[("a", 1)]) is not client
+        assert client.new_variation(include_data_sources=True) is not client
+
+
+def test_contains():
+    tree = MapAdapter(
+        {"a": MapAdapter({}, metadata={"number": 1}), "b": MapAdapter({})}
+    )
+    with Context.from_app(build_app(tree)) as context:
+        client = from_context(context)
+        assert "a" in client
+        assert "z" not in client
+        assert ("a",) in client
+        results = client.search(Key("number") == 1)
+        assert "a" in results
+        assert "b" not in results
@@ -396,6 +396,9 @@ def test_merge_patching(tree):
     with Context.from_app(build_app(tree)) as context:
         client = from_context(context)
         ac = client.write_array([1, 2, 3], metadata={"a": 0, "b": 2}, specs=["spec1"])
+        # Views are reused until the underlying metadata or specs are replaced.
+        assert ac.metadata is ac.metadata
+        assert ac.specs is ac.specs
         ac.patch_metadata(
             metadata_patch={"a": 1, "c": 3}, content_type=patch_mimetypes.MERGE_PATCH
         )
@@ -1,10 +1,12 @@
-import itertools
 from typing import Union
 
 import dask
 import dask.array
 import httpx
 import numpy
+from dask.blockwise import blockwise
+from dask.highlevelgraph import HighLevelGraph
+from dask.layers import ArrayBlockwiseDep, ArrayChunkShapeDep
 from numpy.typing import NDArray
 
 from ..structures.core import STRUCTURE_TYPES
@@ -12,6 +14,13 @@ from .base import BaseClient
 from .utils import export_util, handle_error, params_from_slice
 
 
+class _ArrayBlockIndexDep(ArrayBlockwiseDep):
+    "Produce the block index itself, given a block index"
+
+    def __getitem__(self, idx):
+        return idx
+
+
 class _DaskArrayClient(BaseClient):
     "Client-side wrapper around an array-like that returns dask arrays"
 
@@ -140,23 +149,28 @@ class _DaskArrayClient(BaseClient):
         # dask array.
         name = "remote-dask-array-" f"{self.uri}"
         chunks = structure.chunks
-        # Count the number of blocks along each axis.
-        num_blocks = (range(len(n)) for n in chunks)
-        # Loop over each block index --- e.g. (0, 0), (0, 1), (0, 2) .... ---
-        # and build a dask task encoding the method for fetching its data from
-        # the server.
-        dask_tasks = {
-            (name,)
-            + block: (
-                self._get_block,
-                block,
-                dtype,
-                tuple(chunks[dim][i] for dim, i in enumerate(block)),
-            )
-            for block in itertools.product(*num_blocks)
-        }
+        # Describe the graph as a single Blockwise layer: one task per block,
+        # each encoding the method for fetching that block's data from the
+        # server. The block index --- e.g. (0, 0), (0, 1), (0, 2) .... --- and
+        # block shape are produced on demand, so no task is built until dask
+        # needs it. For arrays with very many blocks, this avoids constructing
+        # (and shipping to a distributed scheduler) a large low-level graph.
+        indices = tuple(range(len(chunks)))
+        layer = blockwise(
+            self._get_block,
+            name,
+            indices,
+            _ArrayBlockIndexDep(chunks),
+            indices,
+            dtype,
+            None,
+            ArrayChunkShapeDep(chunks),
+            indices,
+            numblocks={},
+        )
+        graph = HighLevelGraph.from_collections(name, layer, dependencies=())
         dask_array = dask.array.Array(
-            dask=dask_tasks, name=name, chunks=chunks, dtype=dtype, shape=shape
+            graph, name=name, chunks=chunks, dtype=dtype, shape=shape
         )
         if slice is not None:
             dask_array = dask_array[slice]
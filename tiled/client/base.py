@@ -110,6 +110,10 @@ class BaseClient:
         self._context = context
         self._item = item
         self._cached_len = None  # a cache just for __len__
+        # Caches for the metadata and specs views, each stored alongside the
+        # object it was made from so it can be invalidated when that is replaced
+        self._cached_metadata_view = None
+        self._cached_specs_view = None
         self.structure_clients = structure_clients
         self._metadata_revisions = None
         self._include_data_sources = include_data_sources
@@ -202,7 +206,16 @@ class BaseClient:
         # Ensure this is immutable (at the top level) to help the user avoid
         # getting the wrong impression that editing this would update anything
         # persistent.
-        return DictView(self._item["attributes"]["metadata"])
+        metadata = self._item["attributes"]["metadata"]
+        # Reuse the view until the metadata is replaced, as by refresh() or
+        # update_metadata(), to avoid allocating a new one on every access.
+        if self._cached_metadata_view is not None:
+            source, view = self._cached_metadata_view
+            if source is metadata:
+                return view
+        view = DictView(metadata)
+        self._cached_metadata_view = (metadata, view)
+        return view
 
     def metadata_copy(self):
         """
@@ -216,7 +229,15 @@ class BaseClient:
     @property
     def specs(self):
         "List of specifications describing the structure of the metadata and/or data."
-        return ListView([Spec(**spec) for spec in self._item["attributes"]["specs"]])
+        specs = self._item["attributes"]["specs"]
+        # As in metadata, reuse the view until the specs are replaced.
+        if self._cached_specs_view is not None:
+            source, view = self._cached_specs_view
+            if source is specs:
+                return view
+        view = ListView([Spec(**spec) for spec in specs])
+        self._cached_specs_view = (specs, view)
+        return view
 
     @property
     def uri(self):
@@ -263,6 +284,13 @@ client or pass the optional parameter `include_data_sources=True` to
         """
         This is intended primarily for internal use and use by subclasses.
         """
+        if (
+            structure_clients is UNCHANGED
+            and include_data_sources is UNCHANGED
+            and not kwargs
+        ):
+            # Nothing would vary, so skip constructing an identical copy.
+            return self
         if structure_clients is UNCHANGED:
             structure_clients = self.structure_clients
         if include_data_sources is UNCHANGED:
@@ -144,6 +144,14 @@ class Container(BaseClient, collections.abc.Mapping, IndexersMixin):
 
         This is intended primarily for internal use and use by subclasses.
         """
+        if (
+            structure_clients is UNCHANGED
+            and queries is UNCHANGED
+            and sorting is UNCHANGED
+            and not kwargs
+        ):
+            # Nothing would vary, so skip constructing an identical copy.
+            return self
         if isinstance(structure_clients, str):
             structure_clients = DEFAULT_STRUCTURE_CLIENT_DISPATCH[structure_clients]
         if structure_clients is UNCHANGED:
@@ -337,6 +345,29 @@ class Container(BaseClient, collections.abc.Mapping, IndexersMixin):
             )
         return result
 
+    def __contains__(self, key):
+        # The default implementation, inherited from Mapping, calls
+        # __getitem__, which fetches the full item and constructs a client for
+        # it only to throw it away. Instead, ask the server only whether the key
+        # is present, without requesting any of its fields.
+        if not isinstance(key, str):
+            # Leave tuple lookups like ('a', 'b') in node to __getitem__.
+            return super().__contains__(key)
+        contents = self.item["attributes"]["structure"]["contents"]
+        if (not self._queries) and (key in (contents or {})):
+            return True
+        content = handle_error(
+            self.context.http_client.get(
+                self.item["links"]["search"],
+                headers={"Accept": MSGPACK_MIME_TYPE},
+                params={
+                    "fields": "",
+                    **_queries_to_params(KeyLookup(key), *self._queries),
+                },
+            )
+        ).json()
+        return bool(content["data"])
+
     def delete(self, key):
         self._cached_len = None
         handle_error(self.context.http_client.delete(f"{self.uri}/{key}"))
@@ -20,6 +20,9 @@ class _DaskDataFrameClient(BaseClient):
     "Client-side wrapper around an dataframe-like that returns dask dataframes"
 
     def new_variation(self, structure=UNCHANGED, **kwargs):
+        if structure is UNCHANGED and not kwargs:
+            # Nothing would vary, so skip constructing an identical copy.
+            return self
         if structure is UNCHANGED:
             structure = self._structure
         return super().new_variation(structure=structure, **kwargs)